@@ -4,21 +4,31 @@ Quality Gates Monitoring Script
 Performs basic health checks on the repository
 """
 import os
+import shutil
 import subprocess
 import json
+import time
 from datetime import datetime
 
-def run_command(cmd):
-    """Run a shell command and return the result"""
+# Resolve git once so each check does not repeat the PATH lookup
+GIT = shutil.which("git") or "git"
+
+# Last report, reused while HEAD is unchanged and the TTL has not expired
+_CACHE = {"ts": 0.0, "head": None, "report": None}
+DEFAULT_TTL = 60
+HIDDEN_TTL = 600
+
+def run_command(args):
+    """Run a command (argv list, no shell) and return the result"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(args, capture_output=True, text=True)
         return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
     except Exception as e:
         return False, "", str(e)
 
 def check_git_status():
     """Check Git repository status"""
-    success, stdout, stderr = run_command("git status --porcelain")
+    success, stdout, stderr = run_command([GIT, "status", "--porcelain"])
     return {
         "name": "Git Status",
         "status": "PASS" if success and not stdout else "FAIL",
@@ -27,12 +37,28 @@ def check_git_status():
 
 def check_remote_sync():
     """Check if local is in sync with remote"""
-    success, stdout, stderr = run_command("git status -uno")
-    is_synced = "up to date" in stdout.lower()
+    success, upstream, stderr = run_command([GIT, "rev-parse", "--abbrev-ref", "@{upstream}"])
+    if success:
+        success, stdout, stderr = run_command(
+            [GIT, "rev-list", "--left-right", "--count", "HEAD...@{upstream}"]
+        )
+    if not success:
+        return {
+            "name": "Remote Sync",
+            "status": "WARN",
+            "details": f"Could not compare with upstream: {stderr or 'git command failed'}",
+            "ahead": None,
+            "behind": None
+        }
+    
+    ahead, behind = (int(n) for n in stdout.split())
+    is_synced = ahead == 0 and behind == 0
     return {
         "name": "Remote Sync",
         "status": "PASS" if is_synced else "WARN",
-        "details": "Local branch is up to date with remote" if is_synced else "May need push/pull"
+        "details": f"Local branch is up to date with {upstream}" if is_synced else f"May need push/pull ({ahead} ahead, {behind} behind {upstream})",
+        "ahead": ahead,
+        "behind": behind
     }
 
 def check_file_structure():
@@ -45,8 +71,21 @@ def check_file_structure():
         "details": "All required files present" if not missing_files else f"Missing: {missing_files}"
     }
 
-def main():
-    """Run all quality checks"""
+def get_head():
+    """Return the current HEAD commit id, or None outside a git repository"""
+    success, stdout, stderr = run_command([GIT, "rev-parse", "HEAD"])
+    return stdout if success else None
+
+def check(visible=True, ttl=None):
+    """Run all quality checks, reusing the cached report while HEAD is unchanged"""
+    if ttl is None:
+        ttl = DEFAULT_TTL if visible else HIDDEN_TTL
+    
+    head = get_head()
+    if (_CACHE["report"] is not None and head == _CACHE["head"]
+            and time.time() - _CACHE["ts"] < ttl):
+        return _CACHE["report"]
+    
     checks = [
         check_git_status(),
         check_remote_sync(),
@@ -59,6 +98,12 @@ def main():
         "checks": checks
     }
     
+    _CACHE.update(ts=time.time(), head=head, report=report)
+    return report
+
+def main(ttl=DEFAULT_TTL):
+    """Run all quality checks and print the report"""
+    report = check(ttl=ttl)
     print(json.dumps(report, indent=2))
     return report
 
@@ -10,21 +10,125 @@ providing continuous context and memory for AI development sessions.
 import os
 import sys
 import json
+import mmap
+import shutil
 import yaml
+import pickle
+import pickletools
 import argparse
 import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Bump when the parsing or shape of knowledge_data changes so old snapshots are rejected
+SNAPSHOT_FORMAT = 2
+
+# Marker line identifying the auto-load hook in ~/.bashrc
+BASHRC_HOOK_MARKER = b"YouTube Autopilot - Knowledge Base Auto-Loader"
+
+# Knowledge card formats, in load order (later formats win for the same card)
+CARD_SUFFIXES = (".yaml", ".json")
+
+def _hash_bytes(data: bytes) -> str:
+    """Hash file content for change detection (BLAKE2b, faster than MD5 on 64-bit)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _hash_file(path: Path) -> str:
+    """Hash a file in fixed-size chunks without holding it all in memory"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _file_record(content: bytes, st: os.stat_result) -> Dict[str, Any]:
+    """Build the status entry for a tracked file from its stat and content"""
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": _hash_bytes(content)}
+
+def _stat_record(path: Path) -> Tuple[Path, Dict[str, Any]]:
+    """Build the status entry for a tracked file that is watched but not loaded"""
+    st = os.stat(path)
+    return path, {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": _hash_file(path)}
+
+def _read_bytes(path: Path) -> Tuple[Path, bytes, Dict[str, Any]]:
+    """Read a tracked file in binary mode, returning its status entry alongside"""
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        content = f.read()
+    return path, content, _file_record(content, st)
+
+def _load_card(path: Path) -> Tuple[Path, Any, Dict[str, Any]]:
+    """Parse a JSON or YAML knowledge card, returning its status entry alongside"""
+    path, raw, record = _read_bytes(path)
+    if path.suffix == ".json":
+        return path, json.loads(raw), record
+    return path, yaml.load(raw, Loader=YAMLLoader), record
+
+def _scan_files(root: Path, suffixes: Tuple[str, ...], recursive: bool = False) -> List[Path]:
+    """List files under root ending in one of suffixes, using os.scandir's cached entry types"""
+    found = []
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    found.append(Path(entry.path))
+    return found
+
+def _scan_cards(cards_path: Path) -> Tuple[List[str], List[Path], List[Path]]:
+    """Scan knowledge_cards once, returning (categories, loaded cards, watched-only cards)
+    
+    Cards directly inside a category directory are loaded; cards in nested
+    subdirectories or directly in knowledge_cards are only tracked for changes.
+    Loaded cards are ordered YAML before JSON so a migrated card wins over a
+    leftover YAML copy.
+    """
+    categories, loaded, watched = [], [], []
+    with os.scandir(cards_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                categories.append(entry.name)
+                category_path = Path(entry.path)
+                for card_file in _scan_files(category_path, CARD_SUFFIXES, recursive=True):
+                    (loaded if card_file.parent == category_path else watched).append(card_file)
+            elif entry.name.endswith(CARD_SUFFIXES) and entry.is_file():
+                watched.append(Path(entry.path))
+    loaded.sort(key=lambda p: CARD_SUFFIXES.index(p.suffix))
+    return categories, loaded, watched
+
+def _parallel_map(func: Callable, items: List[Any]) -> List[Any]:
+    """Map func over items on a thread pool so file reads overlap"""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(func, items))
 
 class YouTubeKnowledgeLoader:
     """Auto-loader for the YouTube Autopilot knowledge base"""
     
-    def __init__(self, repo_root: Optional[str] = None):
+    def __init__(self, repo_root: Optional[str] = None, optimize_snapshot: bool = False,
+                 pretty_status: bool = False):
         self.repo_root = Path(repo_root) if repo_root else Path(__file__).parent.parent
         self.kb_path = self.repo_root / "knowledge_base" / ".agent_kb"
         self.cache_path = self.repo_root / ".knowledge_cache"
         self.status_file = self.cache_path / "loader_status.json"
+        self.snapshot_file = self.cache_path / "snapshot.pkl"
+        self.optimize_snapshot = optimize_snapshot
+        self.pretty_status = pretty_status
         
         # Ensure cache directory exists
         self.cache_path.mkdir(exist_ok=True)
@@ -37,6 +141,8 @@ class YouTubeKnowledgeLoader:
             "version": "1.0.0",
             "project_type": "youtube_autopilot"
         }
+        self._snapshot_key = None
+        self._file_hashes: Dict[str, Dict[str, Any]] = {}
     
     def setup_auto_loading(self) -> bool:
         """Set up automatic knowledge base loading for future sessions"""
@@ -55,12 +161,23 @@ fi
             # Add to .bashrc if not already present
             bashrc_path = Path.home() / ".bashrc"
             if bashrc_path.exists():
-                with open(bashrc_path, 'r') as f:
-                    content = f.read()
+                # Resolve symlinks so the replace below updates the real file
+                bashrc_path = bashrc_path.resolve()
+                with open(bashrc_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            hook_present = mm.find(BASHRC_HOOK_MARKER) != -1
+                    else:
+                        hook_present = False
                 
-                if "YouTube Autopilot - Knowledge Base Auto-Loader" not in content:
-                    with open(bashrc_path, 'a') as f:
+                if not hook_present:
+                    # Write original + hook to a temp file and swap it in atomically
+                    tmp_path = bashrc_path.with_name(bashrc_path.name + ".tmp")
+                    shutil.copyfile(bashrc_path, tmp_path)
+                    shutil.copymode(bashrc_path, tmp_path)
+                    with open(tmp_path, 'a') as f:
                         f.write(bashrc_hook)
+                    os.replace(tmp_path, bashrc_path)
                     print("✅ Added auto-loading hook to .bashrc")
                 else:
                     print("✅ Auto-loading hook already exists in .bashrc")
@@ -91,30 +208,42 @@ echo "✅ Knowledge Base loaded and ready!"
             print(f"❌ Error setting up auto-loading: {e}")
             return False
     
-    def load_knowledge_base(self, quiet: bool = False) -> bool:
+    def load_knowledge_base(self, quiet: bool = False, use_snapshot: bool = True) -> bool:
         """Load the complete knowledge base into memory"""
         try:
             if not quiet:
                 print("🎥 Loading YouTube Autopilot Knowledge Base...")
             
+            # Reuse the last snapshot when no tracked file has changed
+            if use_snapshot and self._load_snapshot():
+                if not quiet:
+                    print("✅ Loaded knowledge base from snapshot (no changes detected)")
+                    print("🎯 YouTube Autopilot Knowledge Base loaded successfully!")
+                    self._print_summary()
+                return True
+            
+            # Status entries are collected from the bytes read below
+            self._file_hashes = {}
+            
             # Load manifest
             manifest_path = self.kb_path / "_manifest.json"
             if manifest_path.exists():
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    self.knowledge_data["manifest"] = json.load(f)
+                _, raw, record = _read_bytes(manifest_path)
+                self.knowledge_data["manifest"] = json.loads(raw)
+                self._file_hashes[str(manifest_path)] = record
                 if not quiet:
                     print("✅ Loaded knowledge base manifest")
             
             # Load core documents
             core_docs_path = self.kb_path / "core_docs"
             if core_docs_path.exists():
-                for doc_file in core_docs_path.glob("*.md"):
-                    with open(doc_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                for doc_file, raw, record in _parallel_map(_read_bytes, _scan_files(core_docs_path, (".md",))):
+                    self._file_hashes[str(doc_file)] = record
+                    content = raw.decode('utf-8')
                     self.knowledge_data["core_docs"][doc_file.name] = {
                         "content": content,
                         "size": len(content),
-                        "hash": hashlib.md5(content.encode()).hexdigest(),
+                        "hash": record["hash"],
                         "loaded_at": datetime.now().isoformat()
                     }
                 if not quiet:
@@ -123,19 +252,20 @@ echo "✅ Knowledge Base loaded and ready!"
             # Load knowledge cards
             cards_path = self.kb_path / "knowledge_cards"
             if cards_path.exists():
-                for category_dir in cards_path.iterdir():
-                    if category_dir.is_dir():
-                        category_name = category_dir.name
-                        self.knowledge_data["knowledge_cards"][category_name] = {}
-                        
-                        for card_file in category_dir.glob("*.yaml"):
-                            with open(card_file, 'r', encoding='utf-8') as f:
-                                content = yaml.safe_load(f)
-                            self.knowledge_data["knowledge_cards"][category_name][card_file.stem] = {
-                                "content": content,
-                                "file": str(card_file),
-                                "loaded_at": datetime.now().isoformat()
-                            }
+                categories, card_files, watched_files = _scan_cards(cards_path)
+                for category in categories:
+                    self.knowledge_data["knowledge_cards"][category] = {}
+                
+                for watched_file, record in _parallel_map(_stat_record, watched_files):
+                    self._file_hashes[str(watched_file)] = record
+                
+                for card_file, content, record in _parallel_map(_load_card, card_files):
+                    self._file_hashes[str(card_file)] = record
+                    self.knowledge_data["knowledge_cards"][card_file.parent.name][card_file.stem] = {
+                        "content": content,
+                        "file": str(card_file),
+                        "loaded_at": datetime.now().isoformat()
+                    }
                 
                 total_cards = sum(len(cards) for cards in self.knowledge_data["knowledge_cards"].values())
                 if not quiet:
@@ -147,6 +277,7 @@ echo "✅ Knowledge Base loaded and ready!"
             # Update status
             self.knowledge_data["loaded_at"] = datetime.now().isoformat()
             self._save_status()
+            self._save_snapshot()
             
             if not quiet:
                 print("🎯 YouTube Autopilot Knowledge Base loaded successfully!")
@@ -159,29 +290,36 @@ echo "✅ Knowledge Base loaded and ready!"
             return False
     
     def _load_youtube_specific_data(self, quiet: bool = False) -> None:
-        """Load YouTube-specific project data"""
+        """Load YouTube-specific project data
+        
+        A file's status entry is recorded only after it parses, so a file
+        that fails to load keeps showing up as changed.
+        """
         try:
             # Load automation status
             automation_status_file = self.repo_root / "automation_status.json"
             if automation_status_file.exists():
-                with open(automation_status_file, 'r') as f:
-                    self.knowledge_data["automation_status"] = json.load(f)
+                _, raw, record = _read_bytes(automation_status_file)
+                self.knowledge_data["automation_status"] = json.loads(raw)
+                self._file_hashes[str(automation_status_file)] = record
                 if not quiet:
                     print("✅ Loaded automation status")
             
             # Load automation schedule
             schedule_file = self.repo_root / "automation_schedule.json"
             if schedule_file.exists():
-                with open(schedule_file, 'r') as f:
-                    self.knowledge_data["automation_schedule"] = json.load(f)
+                _, raw, record = _read_bytes(schedule_file)
+                self.knowledge_data["automation_schedule"] = json.loads(raw)
+                self._file_hashes[str(schedule_file)] = record
                 if not quiet:
                     print("✅ Loaded automation schedule")
             
             # Load maintenance reports
             maintenance_file = self.repo_root / "maintenance_report.md"
             if maintenance_file.exists():
-                with open(maintenance_file, 'r', encoding='utf-8') as f:
-                    self.knowledge_data["maintenance_report"] = f.read()
+                _, raw, record = _read_bytes(maintenance_file)
+                self.knowledge_data["maintenance_report"] = raw.decode('utf-8')
+                self._file_hashes[str(maintenance_file)] = record
                 if not quiet:
                     print("✅ Loaded maintenance report")
                     
@@ -195,11 +333,11 @@ echo "✅ Knowledge Base loaded and ready!"
             print("🔄 Updating YouTube Autopilot Knowledge Base...")
             
             # Check for changes
-            changes_detected = self._detect_changes()
+            changes_detected = self._detect_changes(verify=True)
             
             if changes_detected:
                 print("📝 Changes detected, reloading knowledge base...")
-                return self.load_knowledge_base()
+                return self.load_knowledge_base(use_snapshot=False)
             else:
                 print("✅ Knowledge base is up to date")
                 return True
@@ -215,9 +353,10 @@ echo "✅ Knowledge Base loaded and ready!"
                 return json.load(f)
         return {"status": "not_loaded"}
     
-    def print_status(self) -> None:
+    def print_status(self, status: Optional[Dict[str, Any]] = None) -> None:
         """Print current knowledge base status"""
-        status = self.get_status()
+        if status is None:
+            status = self.get_status()
         
         print("🎥 YouTube Autopilot Knowledge Base Status")
         print("=" * 50)
@@ -239,48 +378,66 @@ echo "✅ Knowledge Base loaded and ready!"
             for category, count in status["categories"].items():
                 print(f"   • {category}: {count} cards")
     
-    def _detect_changes(self) -> bool:
-        """Detect if knowledge base files have changed"""
+    def _tracked_files(self) -> List[Path]:
+        """List every file whose changes should trigger a reload"""
+        tracked = []
+        
+        # Manifest
+        manifest_path = self.kb_path / "_manifest.json"
+        if manifest_path.exists():
+            tracked.append(manifest_path)
+        
+        # Core documents
+        core_docs_path = self.kb_path / "core_docs"
+        if core_docs_path.exists():
+            tracked.extend(_scan_files(core_docs_path, (".md",)))
+        
+        # Knowledge cards
+        cards_path = self.kb_path / "knowledge_cards"
+        if cards_path.exists():
+            _, card_files, watched_files = _scan_cards(cards_path)
+            tracked.extend(card_files)
+            tracked.extend(watched_files)
+        
+        # YouTube-specific files
+        for file_path in ["automation_status.json", "automation_schedule.json", "maintenance_report.md"]:
+            file_full_path = self.repo_root / file_path
+            if file_full_path.exists():
+                tracked.append(file_full_path)
+        
+        return tracked
+    
+    def _detect_changes(self, verify: bool = False) -> bool:
+        """Detect if knowledge base files have changed
+        
+        Files whose mtime and size match the saved status are treated as
+        unchanged without being read. With verify=True, a file whose stat
+        differs is hashed and only counts as changed if its content did.
+        """
         try:
             current_status = self.get_status()
-            if not current_status.get("file_hashes"):
+            file_hashes = current_status.get("file_hashes")
+            if not file_hashes:
                 return True
             
-            # Check core documents
-            core_docs_path = self.kb_path / "core_docs"
-            if core_docs_path.exists():
-                for doc_file in core_docs_path.glob("*.md"):
-                    with open(doc_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    current_hash = hashlib.md5(content.encode()).hexdigest()
-                    stored_hash = current_status["file_hashes"].get(str(doc_file))
-                    
-                    if current_hash != stored_hash:
-                        return True
+            # Any added or removed file is a change; no need to stat anything
+            tracked = self._tracked_files()
+            if sorted(str(p) for p in tracked) != current_status.get("tracked_paths"):
+                return True
             
-            # Check knowledge cards
-            cards_path = self.kb_path / "knowledge_cards"
-            if cards_path.exists():
-                for card_file in cards_path.rglob("*.yaml"):
-                    with open(card_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    current_hash = hashlib.md5(content.encode()).hexdigest()
-                    stored_hash = current_status["file_hashes"].get(str(card_file))
-                    
-                    if current_hash != stored_hash:
-                        return True
-            
-            # Check YouTube-specific files
-            for file_path in ["automation_status.json", "automation_schedule.json", "maintenance_report.md"]:
-                file_full_path = self.repo_root / file_path
-                if file_full_path.exists():
-                    with open(file_full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    current_hash = hashlib.md5(content.encode()).hexdigest()
-                    stored_hash = current_status["file_hashes"].get(str(file_full_path))
-                    
-                    if current_hash != stored_hash:
-                        return True
+            for file_path in tracked:
+                stored = file_hashes.get(str(file_path))
+                if not isinstance(stored, dict):
+                    return True
+                
+                st = os.stat(file_path)
+                if st.st_mtime_ns == stored.get("mtime_ns") and st.st_size == stored.get("size"):
+                    continue
+                
+                if not verify:
+                    return True
+                if _hash_file(file_path) != stored.get("hash"):
+                    return True
             
             return False
             
@@ -290,71 +447,104 @@ echo "✅ Knowledge Base loaded and ready!"
     def _save_status(self) -> None:
         """Save current knowledge base status"""
         try:
-            # Calculate file hashes
-            file_hashes = {}
-            
-            # Core documents
-            core_docs_path = self.kb_path / "core_docs"
-            if core_docs_path.exists():
-                for doc_file in core_docs_path.glob("*.md"):
-                    with open(doc_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    file_hashes[str(doc_file)] = hashlib.md5(content.encode()).hexdigest()
-            
-            # Knowledge cards
-            cards_path = self.kb_path / "knowledge_cards"
-            if cards_path.exists():
-                for card_file in cards_path.rglob("*.yaml"):
-                    with open(card_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    file_hashes[str(card_file)] = hashlib.md5(content.encode()).hexdigest()
-            
-            # YouTube-specific files
-            for file_path in ["automation_status.json", "automation_schedule.json", "maintenance_report.md"]:
-                file_full_path = self.repo_root / file_path
-                if file_full_path.exists():
-                    with open(file_full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    file_hashes[str(file_full_path)] = hashlib.md5(content.encode()).hexdigest()
+            # Stat and hash of every tracked file, recorded during the load pass
+            file_hashes = self._file_hashes
             
             # Prepare status data
             categories = {}
             for category, cards in self.knowledge_data["knowledge_cards"].items():
                 categories[category] = len(cards)
             
+            self._snapshot_key = self._compute_snapshot_key(file_hashes)
+            
             status_data = {
                 "status": "loaded",
                 "loaded_at": self.knowledge_data["loaded_at"],
                 "version": self.knowledge_data["version"],
                 "project_type": "youtube_autopilot",
                 "core_docs_count": len(self.knowledge_data["core_docs"]),
-                "knowledge_cards_count": sum(len(cards) for cards in self.knowledge_data["knowledge_cards"].values()),
+                "knowledge_cards_count": sum(categories.values()),
                 "categories_count": len(self.knowledge_data["knowledge_cards"]),
                 "categories": categories,
                 "file_hashes": file_hashes,
+                "tracked_paths": sorted(file_hashes),
                 "repo_root": str(self.repo_root),
-                "kb_path": str(self.kb_path)
+                "kb_path": str(self.kb_path),
+                "snapshot_key": self._snapshot_key
             }
             
+            # Compact by default; the status file is read back by this script
             with open(self.status_file, 'w') as f:
-                json.dump(status_data, f, indent=2)
+                if self.pretty_status:
+                    json.dump(status_data, f, indent=2)
+                else:
+                    json.dump(status_data, f, separators=(",", ":"))
                 
         except Exception as e:
             print(f"⚠️ Warning: Could not save status: {e}")
     
+    def _compute_snapshot_key(self, file_hashes: Dict[str, Dict[str, Any]]) -> str:
+        """Key the snapshot on the tracked file table plus the snapshot format"""
+        return _hash_bytes(json.dumps({
+            "format": SNAPSHOT_FORMAT,
+            "version": self.knowledge_data["version"],
+            "file_hashes": file_hashes
+        }, sort_keys=True).encode())
+    
+    def _save_snapshot(self) -> None:
+        """Pickle the assembled knowledge data, keyed by the saved file hashes"""
+        try:
+            raw = pickle.dumps((self._snapshot_key, self.knowledge_data), protocol=pickle.HIGHEST_PROTOCOL)
+            if self.optimize_snapshot:
+                # Slower to write, but smaller and faster to load
+                raw = pickletools.optimize(raw)
+            with open(self.snapshot_file, 'wb') as f:
+                f.write(raw)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not save snapshot: {e}")
+    
+    def _load_snapshot(self) -> bool:
+        """Restore knowledge data from the snapshot if it matches the current files"""
+        try:
+            if not self.snapshot_file.exists() or self._detect_changes():
+                return False
+            
+            with open(self.snapshot_file, 'rb') as f:
+                snapshot_key, knowledge_data = pickle.load(f)
+            # Recompute with the current format so snapshots from older code are rejected
+            expected_key = self._compute_snapshot_key(self.get_status().get("file_hashes", {}))
+            if snapshot_key != expected_key:
+                return False
+            
+            self.knowledge_data = knowledge_data
+            self._snapshot_key = snapshot_key
+            
+            # An explicit --optimize-snapshot applies to a reused snapshot too
+            if self.optimize_snapshot:
+                self._save_snapshot()
+            return True
+            
+        except Exception:
+            return False
+    
     def _print_summary(self) -> None:
         """Print knowledge base loading summary"""
+        core_docs = self.knowledge_data["core_docs"]
+        knowledge_cards = self.knowledge_data["knowledge_cards"]
+        totals = Counter()
+        
         print("\n📊 YouTube Autopilot Knowledge Base Summary:")
-        print(f"   📚 Core Documents: {len(self.knowledge_data['core_docs'])}")
+        print(f"   📚 Core Documents: {len(core_docs)}")
         
-        for doc_name, doc_data in self.knowledge_data["core_docs"].items():
+        for doc_name, doc_data in core_docs.items():
             print(f"      • {doc_name} ({doc_data['size']} chars)")
         
-        print(f"   🗂️ Knowledge Categories: {len(self.knowledge_data['knowledge_cards'])}")
+        print(f"   🗂️ Knowledge Categories: {len(knowledge_cards)}")
         
-        for category, cards in self.knowledge_data["knowledge_cards"].items():
-            print(f"      • {category}: {len(cards)} cards")
-            for card_name in cards.keys():
+        for category, cards in knowledge_cards.items():
+            totals[category] = len(cards)
+            print(f"      • {category}: {totals[category]} cards")
+            for card_name in cards:
                 print(f"        - {card_name}")
         
         # YouTube-specific data
@@ -365,7 +555,7 @@ echo "✅ Knowledge Base loaded and ready!"
         if "maintenance_report" in self.knowledge_data:
             print(f"   🔧 Maintenance Report: Loaded")
         
-        print(f"\n🎯 Total Knowledge Items: {len(self.knowledge_data['core_docs']) + sum(len(cards) for cards in self.knowledge_data['knowledge_cards'].values())}")
+        print(f"\n🎯 Total Knowledge Items: {len(core_docs) + sum(totals.values())}")
 
 def main():
     """Main function for command-line usage"""
@@ -375,12 +565,15 @@ def main():
     parser.add_argument("--update", action="store_true", help="Update knowledge base")
     parser.add_argument("--status", action="store_true", help="Show knowledge base status")
     parser.add_argument("--quiet", action="store_true", help="Quiet mode (minimal output)")
+    parser.add_argument("--optimize-snapshot", action="store_true", help="Optimize the cached snapshot for faster loads (slower write)")
+    parser.add_argument("--pretty", action="store_true", help="Write the status file as indented JSON")
     parser.add_argument("--repo-root", help="Repository root path (auto-detected if not provided)")
     
     args = parser.parse_args()
     
     # Initialize loader
-    loader = YouTubeKnowledgeLoader(args.repo_root)
+    loader = YouTubeKnowledgeLoader(args.repo_root, optimize_snapshot=args.optimize_snapshot,
+                                    pretty_status=args.pretty)
     
     # Execute requested action
     if args.setup:
@@ -397,8 +590,8 @@ def main():
         sys.exit(0)
     else:
         # Default: show status and offer to load
-        loader.print_status()
         status = loader.get_status()
+        loader.print_status(status)
         
         if status.get("status") != "loaded":
             print("\n💡 To load the knowledge base, run:")
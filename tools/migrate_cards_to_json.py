@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Knowledge Card Migration for YouTube Autopilot
+Converts YAML knowledge cards to JSON so the loader can parse them with the
+C-accelerated json decoder instead of PyYAML.
+"""
+
+import sys
+import json
+import yaml
+import argparse
+from pathlib import Path
+from typing import Optional
+
+def migrate_card(card_file: Path, keep_yaml: bool = False, force: bool = False) -> Optional[Path]:
+    """Convert one YAML card to a sibling JSON card
+    
+    Returns None without touching anything if the JSON card already exists,
+    since the loader prefers it and it may have been edited since the last run.
+    """
+    json_file = card_file.with_suffix(".json")
+    if json_file.exists() and not force:
+        return None
+    
+    with open(card_file, 'r', encoding='utf-8') as f:
+        content = yaml.safe_load(f)
+    
+    tmp_file = json_file.with_suffix(".json.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        # Dates and other YAML-only scalars are stored as strings
+        json.dump(content, f, ensure_ascii=False, indent=2, default=str)
+    tmp_file.replace(json_file)
+    
+    if not keep_yaml:
+        card_file.unlink()
+    return json_file
+
+def main():
+    """Main function for command-line usage"""
+    parser = argparse.ArgumentParser(description="Migrate YAML knowledge cards to JSON")
+    parser.add_argument("--keep-yaml", action="store_true", help="Keep the original YAML files")
+    parser.add_argument("--force", action="store_true", help="Overwrite JSON cards that already exist")
+    parser.add_argument("--repo-root", help="Repository root path (auto-detected if not provided)")
+    
+    args = parser.parse_args()
+    
+    repo_root = Path(args.repo_root) if args.repo_root else Path(__file__).parent.parent
+    cards_path = repo_root / "knowledge_base" / ".agent_kb" / "knowledge_cards"
+    if not cards_path.exists():
+        print(f"❌ Knowledge cards directory not found: {cards_path}")
+        sys.exit(1)
+    
+    migrated = 0
+    skipped = 0
+    for card_file in sorted(cards_path.rglob("*.yaml")):
+        try:
+            json_file = migrate_card(card_file, keep_yaml=args.keep_yaml, force=args.force)
+            if json_file is None:
+                print(f"⏭️ {card_file.relative_to(cards_path)}: {card_file.with_suffix('.json').name} already exists, skipped")
+                skipped += 1
+                continue
+            print(f"✅ {card_file.relative_to(cards_path)} -> {json_file.name}")
+            migrated += 1
+        except Exception as e:
+            print(f"❌ Could not migrate {card_file}: {e}")
+    
+    print(f"🎯 Migrated {migrated} knowledge cards")
+    if skipped:
+        print(f"💡 Skipped {skipped} cards with an existing JSON copy (use --force to overwrite)")
+    print("💡 Run: python tools/knowledge_loader.py --update")
+
+if __name__ == "__main__":
+    main()